@@ -1,16 +1,18 @@
 import { Controller, Get, UseGuards } from '@nestjs/common';
-import { execSync } from 'child_process';
+import { execFile } from 'child_process';
 import * as fs from 'fs';
 import * as path from 'path';
+import { promisify } from 'util';
 import { ApiKeyOrJwtGuard } from '../auth/api-key-or-jwt.guard';
 
 const FONT_EXT_RE = /\.(ttf|otf|ttc|woff|woff2)$/i;
+const execFileAsync = promisify(execFile);
 
 @Controller('api/fonts')
 @UseGuards(ApiKeyOrJwtGuard)
 export class FontsController {
   @Get()
-  listFonts(): string[] {
+  async listFonts(): Promise<string[]> {
     const fonts = new Set<string>();
 
     const publicDir = path.join(process.cwd(), 'public');
@@ -27,7 +29,8 @@ export class FontsController {
     }
 
     try {
-      const raw = execSync("fc-list --format='%{family[0]}\\n'", {
+      // Async so a slow fontconfig scan does not stall the event loop for other requests.
+      const { stdout: raw } = await execFileAsync('fc-list', ['--format=%{family[0]}\\n'], {
         timeout: 5000,
         encoding: 'utf-8',
       });
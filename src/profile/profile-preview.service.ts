@@ -1,9 +1,9 @@
 import { Injectable, InternalServerErrorException, Logger } from '@nestjs/common';
-import { execSync } from 'child_process';
-import { spawn } from 'child_process';
+import { execFile, spawn } from 'child_process';
 import * as fs from 'fs';
 import * as os from 'os';
 import * as path from 'path';
+import { promisify } from 'util';
 import { resolveDimensions } from './profile-dimensions';
 import { RenderProfilePreviewDto } from './dto/render-profile-preview.dto';
 import { TextStyleConfigDto } from './dto/create-profile.dto';
@@ -13,6 +13,8 @@ import {
   writeHeadlineHighlightAssFile,
 } from '../video/headline-highlight-ass';
 
+const execFileAsync = promisify(execFile);
+
 @Injectable()
 export class ProfilePreviewService {
   private readonly logger = new Logger(ProfilePreviewService.name);
@@ -76,7 +78,11 @@ export class ProfilePreviewService {
    * 1. public/<fontName>/ folder (picks best bold/italic match by filename)
    * 2. fc-match system lookup with style hint
    */
-  private resolveFontFile(fontName: string, bold: boolean, italic: boolean): string | undefined {
+  private async resolveFontFile(
+    fontName: string,
+    bold: boolean,
+    italic: boolean,
+  ): Promise<string | undefined> {
     const publicDir = path.join(process.cwd(), 'public');
     const familyDir = path.join(publicDir, fontName);
 
@@ -109,10 +115,11 @@ export class ProfilePreviewService {
       const styleHint =
         bold && italic ? 'Bold Italic' : bold ? 'Bold' : italic ? 'Italic' : 'Regular';
       const pattern = `${fontName}:style=${styleHint}`;
-      const result = execSync(`fc-match -f '%{file}' '${pattern.replace(/'/g, "'\\''")}'`, {
+      const { stdout } = await execFileAsync('fc-match', ['-f', '%{file}', pattern], {
         timeout: 3000,
         encoding: 'utf-8',
-      }).trim();
+      });
+      const result = stdout.trim();
       if (result && fs.existsSync(result)) {
         return result;
       }
@@ -144,7 +151,11 @@ export class ProfilePreviewService {
     const subText = dto.subtitleText ?? 'Subtitle baseline';
     const botText = dto.bottomHeadlineText ?? 'Bottom headline';
 
-    const pushText = (style: TextStyleConfigDto, text: string, useHeadlineHighlight: boolean) => {
+    const pushText = async (
+      style: TextStyleConfigDto,
+      text: string,
+      useHeadlineHighlight: boolean,
+    ) => {
       if (!style.enabled) return;
 
       if (useHeadlineHighlight && headlineHasHighlightTags(text)) {
@@ -166,7 +177,7 @@ export class ProfilePreviewService {
 
       const x = this.exprX(style.alignment, style.xOffset);
       const y = this.exprY(style.alignment, style.yOffset);
-      const fontFile = this.resolveFontFile(style.font, style.bold, style.italic);
+      const fontFile = await this.resolveFontFile(style.font, style.bold, style.italic);
 
       const parts = [
         `drawtext=text='${this.escText(text)}'`,
@@ -197,9 +208,9 @@ export class ProfilePreviewService {
       chain.push(parts.join(':'));
     };
 
-    pushText(dto.headline.top, topText, true);
-    pushText(dto.subtitle, subText, false);
-    pushText(dto.headline.bottom, botText, true);
+    await pushText(dto.headline.top, topText, true);
+    await pushText(dto.subtitle, subText, false);
+    await pushText(dto.headline.bottom, botText, true);
 
     const filterComplex = chain.join(',');
     this.logger.debug(`FFmpeg -vf: ${filterComplex}`);
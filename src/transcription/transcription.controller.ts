@@ -15,13 +15,18 @@ import * as multer from 'multer';
 import * as path from 'path';
 import * as fs from 'fs';
 
-const uploadDir = './temp';
-if (!fs.existsSync(uploadDir)) {
-  fs.mkdirSync(uploadDir, { recursive: true });
-}
-
 const storage = multer.diskStorage({
   destination: (req, file, cb) => {
+    // Resolved per request so TRANSCRIBE_UPLOAD_DIR from .env (loaded by ConfigModule after this
+    // module is imported) is honoured. Point at a tmpfs (e.g. /dev/shm) to keep audio off disk;
+    // it must fit the upload limit.
+    const uploadDir = process.env.TRANSCRIBE_UPLOAD_DIR || './temp';
+    try {
+      fs.mkdirSync(uploadDir, { recursive: true });
+    } catch (error) {
+      cb(error as Error, uploadDir);
+      return;
+    }
     cb(null, uploadDir);
   },
   filename: (req, file, cb) => {
@@ -30,29 +35,36 @@ const storage = multer.diskStorage({
   },
 });
 
+// Accept audio files; built once at module load so the filter is a Set lookup per upload.
+const ALLOWED_MIMES = new Set([
+  'audio/mpeg',
+  'audio/mp3',
+  'audio/wav',
+  'audio/webm',
+  'audio/ogg',
+  'audio/flac',
+  'audio/m4a',
+  'audio/x-m4a',
+  'audio/mp4',
+  'audio/x-wav',
+]);
+
+// Also check file extension as fallback
+const ALLOWED_EXTS = new Set(['.mp3', '.wav', '.webm', '.ogg', '.flac', '.m4a', '.mp4']);
+
+const INVALID_FILE_TYPE_MESSAGE = `Invalid file type. Allowed types: ${[...ALLOWED_MIMES].join(', ')}`;
+
 const fileFilter = (req: any, file: Express.Multer.File, cb: multer.FileFilterCallback) => {
-  // Accept audio files
-  const allowedMimes = [
-    'audio/mpeg',
-    'audio/mp3',
-    'audio/wav',
-    'audio/webm',
-    'audio/ogg',
-    'audio/flac',
-    'audio/m4a',
-    'audio/x-m4a',
-    'audio/mp4',
-    'audio/x-wav',
-  ];
+  if (ALLOWED_MIMES.has(file.mimetype)) {
+    cb(null, true);
+    return;
+  }
 
-  // Also check file extension as fallback
-  const allowedExts = ['.mp3', '.wav', '.webm', '.ogg', '.flac', '.m4a', '.mp4'];
   const ext = path.extname(file.originalname).toLowerCase();
-
-  if (allowedMimes.includes(file.mimetype) || allowedExts.includes(ext)) {
+  if (ALLOWED_EXTS.has(ext)) {
     cb(null, true);
   } else {
-    cb(new BadRequestException(`Invalid file type. Allowed types: ${allowedMimes.join(', ')}`));
+    cb(new BadRequestException(INVALID_FILE_TYPE_MESSAGE));
   }
 };
 
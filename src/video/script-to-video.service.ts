@@ -2,6 +2,7 @@ import { Injectable, Logger } from '@nestjs/common';
 import { spawn } from 'child_process';
 import * as fs from 'fs';
 import * as path from 'path';
+import { pipeline } from 'stream/promises';
 import axios from 'axios';
 import { VideoRequest } from '../entities/video-request.entity';
 import { ElevenLabsService } from '../elevenlabs/elevenlabs.service';
@@ -27,6 +28,8 @@ import {
   writeHeadlineHighlightAssFile,
 } from './headline-highlight-ass';
 
+const pad2 = (n: number): string => (n < 10 ? `0${n}` : `${n}`);
+
 /** Thrown when the user stops the request; worker exits without marking completed/failed. */
 export class VideoPipelineCancelledError extends Error {
   readonly code = 'PIPELINE_CANCELLED';
@@ -304,12 +307,21 @@ export class ScriptToVideoService {
   }
 
   private toSrtTime(seconds: number): string {
-    const ms = Math.max(0, Math.round(seconds * 1000));
-    const h = Math.floor(ms / 3600000);
-    const m = Math.floor((ms % 3600000) / 60000);
-    const s = Math.floor((ms % 60000) / 1000);
-    const rem = ms % 1000;
-    return `${String(h).padStart(2, '0')}:${String(m).padStart(2, '0')}:${String(s).padStart(2, '0')},${String(rem).padStart(3, '0')}`;
+    const totalMs = Math.max(0, Math.round(seconds * 1000));
+    const totalSec = Math.floor(totalMs / 1000);
+    const totalMin = Math.floor(totalSec / 60);
+    const h = Math.floor(totalMin / 60);
+    const ms = totalMs % 1000;
+    return `${pad2(h)}:${pad2(totalMin % 60)}:${pad2(totalSec % 60)},${String(ms).padStart(3, '0')}`;
+  }
+
+  /** ASS timestamp (H:MM:SS.cc), derived from integer centiseconds to avoid float modulo drift. */
+  private toAssTime(seconds: number): string {
+    const totalCs = Math.max(0, Math.round(seconds * 100));
+    const totalSec = Math.floor(totalCs / 100);
+    const totalMin = Math.floor(totalSec / 60);
+    const h = Math.floor(totalMin / 60);
+    return `${h}:${pad2(totalMin % 60)}:${pad2(totalSec % 60)}.${pad2(totalCs % 100)}`;
   }
 
   /** Match profile preview / ASS alignment grid (1–9). */
@@ -421,16 +433,16 @@ export class ScriptToVideoService {
   private createSrt(
     timings: Array<{ index: number; text: string; start: number; end: number }>,
   ): string {
-    return timings
-      .map((t, idx) => {
-        // Ensure each cue is a single logical line (no embedded newlines).
-        const cleanText = String(t.text || '')
-          .replace(/\r?\n/g, ' ')
-          .replace(/\s+/g, ' ')
-          .trim();
-        return `${idx + 1}\n${this.toSrtTime(t.start)} --> ${this.toSrtTime(t.end)}\n${cleanText}\n`;
-      })
-      .join('\n');
+    // Appended in place: V8 builds the result as a rope, so no per-cue array or final join.
+    let srt = '';
+    for (let i = 0; i < timings.length; i += 1) {
+      const t = timings[i];
+      // Ensure each cue is a single logical line; \s already covers \r and \n.
+      const cleanText = String(t.text || '').replace(/\s+/g, ' ').trim();
+      if (i > 0) srt += '\n';
+      srt += `${i + 1}\n${this.toSrtTime(t.start)} --> ${this.toSrtTime(t.end)}\n${cleanText}\n`;
+    }
+    return srt;
   }
 
   private createAss(
@@ -439,19 +451,10 @@ export class ScriptToVideoService {
     playResX = 1920,
     playResY = 1080,
   ): string {
-    const toAssTime = (seconds: number) => {
-      const total = Math.max(0, seconds);
-      const h = Math.floor(total / 3600);
-      const m = Math.floor((total % 3600) / 60);
-      const s = Math.floor(total % 60);
-      const cs = Math.floor((total - Math.floor(total)) * 100);
-      return `${h}:${String(m).padStart(2, '0')}:${String(s).padStart(2, '0')}.${String(cs).padStart(2, '0')}`;
-    };
-
     const posPrefix = this.assSubtitlePosPrefix(subtitleStyle, playResX, playResY);
     const lines = timings.map(
       (t) =>
-        `Dialogue: 0,${toAssTime(t.start)},${toAssTime(t.end)},Default,,0,0,0,,${posPrefix}${this.assEscapeText(t.text)}`,
+        `Dialogue: 0,${this.toAssTime(t.start)},${this.toAssTime(t.end)},Default,,0,0,0,,${posPrefix}${this.assEscapeText(t.text)}`,
     );
 
     return [
@@ -495,15 +498,6 @@ export class ScriptToVideoService {
     playResX = 1920,
     playResY = 1080,
   ): string {
-    const toAssTime = (seconds: number) => {
-      const total = Math.max(0, seconds);
-      const h = Math.floor(total / 3600);
-      const m = Math.floor((total % 3600) / 60);
-      const s = Math.floor(total % 60);
-      const cs = Math.floor((total - Math.floor(total)) * 100);
-      return `${h}:${String(m).padStart(2, '0')}:${String(s).padStart(2, '0')}.${String(cs).padStart(2, '0')}`;
-    };
-
     const chunks: Array<Array<{ word: string; start: number; end: number }>> = [];
     let current: Array<{ word: string; start: number; end: number }> = [];
     const MAX_WORDS = 3;
@@ -542,7 +536,7 @@ export class ScriptToVideoService {
           return `{\\k${cs}}${this.assEscapeText(w.word)}`;
         })
         .join(' ');
-      return `Dialogue: 0,${toAssTime(start)},${toAssTime(end)},Default,,0,0,0,,${posPrefix}${karaokeText}`;
+      return `Dialogue: 0,${this.toAssTime(start)},${this.toAssTime(end)},Default,,0,0,0,,${posPrefix}${karaokeText}`;
     });
 
     return [
@@ -786,11 +780,25 @@ export class ScriptToVideoService {
     if (!url) {
       throw new Error(`Kie image (${model}) success but no resultUrls in resultJson`);
     }
-    const imageRes = await axios.get<ArrayBuffer>(url, {
-      responseType: 'arraybuffer',
-      timeout: 120000,
-    });
-    fs.writeFileSync(outputPath, Buffer.from(imageRes.data));
+    await this.downloadToFile(url, outputPath, 120000);
+  }
+
+  /**
+   * Stream a remote file straight to disk so memory stays at one chunk regardless of size.
+   * The timeout covers the whole transfer; a partial file is removed on failure.
+   */
+  private async downloadToFile(url: string, outputPath: string, timeoutMs: number): Promise<void> {
+    try {
+      const res = await axios.get<NodeJS.ReadableStream>(url, {
+        responseType: 'stream',
+        timeout: timeoutMs,
+        signal: AbortSignal.timeout(timeoutMs),
+      });
+      await pipeline(res.data, fs.createWriteStream(outputPath));
+    } catch (err) {
+      fs.rmSync(outputPath, { force: true });
+      throw err;
+    }
   }
 
   private async generateSegmentImageWithRetries(
@@ -1344,11 +1352,7 @@ export class ScriptToVideoService {
               });
 
               const url = await this.kieAiService.getFirstTaskResultUrl(taskId);
-              const videoRes = await axios.get<ArrayBuffer>(url, {
-                responseType: 'arraybuffer',
-                timeout: 180000,
-              });
-              fs.writeFileSync(chunkPath, Buffer.from(videoRes.data));
+              await this.downloadToFile(url, chunkPath, 180000);
               generated = true;
               anyKieGenerated = true;
             } else if (videoModel === 'grok-imagine/image-to-video') {
@@ -1389,11 +1393,7 @@ export class ScriptToVideoService {
               });
 
               const url = await this.kieAiService.getFirstTaskResultUrl(taskId);
-              const videoRes = await axios.get<ArrayBuffer>(url, {
-                responseType: 'arraybuffer',
-                timeout: 180000,
-              });
-              fs.writeFileSync(chunkPath, Buffer.from(videoRes.data));
+              await this.downloadToFile(url, chunkPath, 180000);
               generated = true;
               anyKieGenerated = true;
             } else if (videoModel === 'wan/2-6-text-to-video') {
@@ -1409,11 +1409,7 @@ export class ScriptToVideoService {
               });
 
               const url = await this.kieAiService.getFirstTaskResultUrl(taskId);
-              const videoRes = await axios.get<ArrayBuffer>(url, {
-                responseType: 'arraybuffer',
-                timeout: 180000,
-              });
-              fs.writeFileSync(chunkPath, Buffer.from(videoRes.data));
+              await this.downloadToFile(url, chunkPath, 180000);
               generated = true;
               anyKieGenerated = true;
             }